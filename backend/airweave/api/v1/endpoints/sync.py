@@ -206,7 +206,9 @@ async def run_sync(
     sync_job_schema = schemas.SyncJob.model_validate(sync_job)
 
     sync_dag = await crud.sync_dag.get_by_sync_id(db=db, sync_id=sync_id, current_user=user)
-    sync_dag_schema = schemas.SyncDag.model_validate(sync_dag)
+    if not sync_dag:
+        raise HTTPException(status_code=404, detail="Sync DAG not found")
+    sync_dag_schema = schemas.SyncDag.from_orm_trusted(sync_dag)
 
     user_schema = schemas.User.model_validate(user)
 
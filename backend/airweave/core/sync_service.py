@@ -72,7 +72,7 @@ class SyncService:
         try:
             async with get_db_context() as db:
                 sync_context = await SyncContextFactory.create(
-                    db, sync, sync_job, dag, current_user
+                    db, sync, sync_job, dag, current_user, db_session_factory=get_db_context
                 )
         except Exception as e:
             logger.error(f"Error during sync context creation: {e}")
@@ -39,6 +39,23 @@ class CRUDEntityDefinition(
         result = await db.execute(select(self.model).where(self.model.name == entity_class_name))
         return result.scalar_one_or_none()
 
+    async def get_class_locations(self, db: AsyncSession) -> List[tuple[UUID, str, str]]:
+        """Get the (id, module_name, class_name) of every entity definition.
+
+        Projects only the columns needed to resolve entity classes, avoiding
+        full row hydration.
+
+        Args:
+            db (AsyncSession): The database session
+
+        Returns:
+            List[tuple[UUID, str, str]]: (id, module_name, class_name) per definition
+        """
+        result = await db.execute(
+            select(self.model.id, self.model.module_name, self.model.class_name)
+        )
+        return list(result.all())
+
     async def get_multi_by_source_short_name(
         self, db: AsyncSession, *, source_short_name: str
     ) -> List[EntityDefinition]:
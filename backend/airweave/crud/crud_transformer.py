@@ -1,5 +1,10 @@
 """CRUD operations for transformers."""
 
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from airweave.crud._base_system import CRUDBaseSystem
 from airweave.models.transformer import Transformer
 from airweave.schemas.transformer import TransformerCreate, TransformerUpdate
@@ -8,7 +13,20 @@ from airweave.schemas.transformer import TransformerCreate, TransformerUpdate
 class CRUDTransformer(CRUDBaseSystem[Transformer, TransformerCreate, TransformerUpdate]):
     """CRUD operations for Transformer."""
 
-    pass
+    async def get_callable_locations(self, db: AsyncSession) -> List[tuple[str, str]]:
+        """Get the (module_name, method_name) of every transformer.
+
+        Projects only the columns needed to resolve the transformer callables,
+        avoiding full row hydration.
+
+        Args:
+            db (AsyncSession): The database session
+
+        Returns:
+            List[tuple[str, str]]: (module_name, method_name) per transformer
+        """
+        result = await db.execute(select(Transformer.module_name, Transformer.method_name))
+        return list(result.all())
 
 
 transformer = CRUDTransformer(Transformer)
@@ -17,6 +17,7 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from pydantic import ValidationError
 from starlette.middleware.cors import CORSMiddleware
 
+from airweave import crud
 from airweave.api.v1.api import api_router
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException, PermissionException, unpack_validation_error
@@ -25,6 +26,7 @@ from airweave.db.init_db import init_db
 from airweave.db.session import AsyncSessionLocal
 from airweave.platform.db_sync import sync_platform_components
 from airweave.platform.entities._base import ensure_file_entity_models
+from airweave.platform.locator import resource_locator
 from airweave.platform.scheduler import platform_scheduler
 
 
@@ -42,6 +44,15 @@ async def lifespan(app: FastAPI):
             await sync_platform_components("airweave/platform", db)
         await init_db(db)
 
+        # Warm the resource locator cache in the background so the first sync
+        # does not pay serial import cost for sources, destinations and transformers.
+        resource_locator.warmup(
+            sources=await crud.source.get_all(db),
+            destinations=await crud.destination.get_all(db),
+            transformers=await crud.transformer.get_all(db),
+            entity_definitions=await crud.entity_definition.get_all(db),
+        )
+
     # Start the sync scheduler
     await platform_scheduler.start()
 
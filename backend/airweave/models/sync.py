@@ -4,7 +4,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from airweave.core.shared_models import SyncStatus
@@ -33,7 +34,7 @@ class Sync(OrganizationBase, UserMixin):
         ForeignKey("white_label.id"), nullable=True
     )
     white_label_user_identifier: Mapped[str] = mapped_column(String(256), nullable=True)
-    sync_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    sync_metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     jobs: Mapped[list["SyncJob"]] = relationship(
         "SyncJob",
@@ -1,10 +1,18 @@
 """Settings module for integration authentication settings."""
 
+import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # Optional accelerator, mirroring the CSafeLoader fallback below.
+    import orjson
+except ImportError:
+    orjson = None
+
 from airweave.core.config import settings
 from airweave.platform.auth.schemas import (
     APIKeyAuthSettings,
@@ -18,6 +26,22 @@ from airweave.platform.auth.schemas import (
     TrelloAuthSettings,
 )
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Built once at import so parsing N integrations does a single dict lookup each
+# instead of rebuilding the mapping per integration. AuthType.none has no
+# settings model and is deliberately absent: a missing key means unsupported.
+_AUTH_MODEL_MAP: dict[AuthType, type[BaseAuthSettings]] = {
+    AuthType.oauth2: OAuth2Settings,
+    AuthType.trello_auth: TrelloAuthSettings,
+    AuthType.api_key: APIKeyAuthSettings,
+    AuthType.oauth2_with_refresh: OAuth2WithRefreshSettings,
+    AuthType.oauth2_with_refresh_rotating: OAuth2WithRefreshRotatingSettings,
+    AuthType.native_functionality: NativeFunctionalityAuthSettings,
+    AuthType.config_class: ConfigClassAuthSettings,
+}
+
 
 class IntegrationSettings:
     """Class for loading and parsing integration settings based on the auth_type.
@@ -28,13 +52,18 @@ class IntegrationSettings:
     def __init__(self, file_path: Path):
         """Initializes the IntegrationSettings class.
 
+        Loading is deferred until the first lookup so that importing this module
+        stays cheap for code paths that never touch integrations (CLI help,
+        migrations, worker subprocesses).
+
         Args:
         ----
             file_path (Path): The path to the YAML file containing the integration settings.
 
         """
+        self._file_path = file_path
         self._settings: dict[str, BaseAuthSettings] = {}
-        self.load_settings(file_path)
+        self._loaded = False
 
     def _parse_integration(self, name: str, config: dict[str, Any]) -> BaseAuthSettings:
         """Dynamically parse integration settings based on the auth_type.
@@ -54,35 +83,77 @@ class IntegrationSettings:
 
         """
         auth_type = config.get("auth_type", "")
-        mapping = {
-            AuthType.oauth2: OAuth2Settings,
-            AuthType.trello_auth: TrelloAuthSettings,
-            AuthType.api_key: APIKeyAuthSettings,
-            AuthType.oauth2_with_refresh: OAuth2WithRefreshSettings,
-            AuthType.oauth2_with_refresh_rotating: OAuth2WithRefreshRotatingSettings,
-            AuthType.native_functionality: NativeFunctionalityAuthSettings,
-            AuthType.config_class: ConfigClassAuthSettings,
-            AuthType.none: None,
-        }
-        model = mapping.get(auth_type)
-        config["integration_short_name"] = name
-        if model:
-            return model(**config)
-        else:
+        model = _AUTH_MODEL_MAP.get(auth_type)
+        if model is None:
             raise ValueError(f"Unsupported auth_type for integration {name}: {auth_type}")
+        config["integration_short_name"] = name
+        if orjson is not None:
+            try:
+                # Route through pydantic's Rust JSON validator, which skips the
+                # Python-side keyword coercion of model(**config).
+                return model.model_validate_json(orjson.dumps(config))
+            except TypeError:
+                pass  # Config holds non-JSON-serializable values; validate directly.
+        return model.model_validate(config)
+
+    def load_settings(self) -> None:
+        """Loads and parses integration settings from the YAML file, once.
+
+        Subsequent calls are no-ops; the parsed settings are cached on the
+        instance.
+        """
+        if self._loaded:
+            return
+        data = self._load_raw_settings(self._file_path)
+        self._settings = {
+            name: self._parse_integration(name, config) for name, config in data.items()
+        }
+        self._loaded = True
 
-    def load_settings(self, file_path: Path) -> None:
-        """Loads and parses integration settings from a YAML file.
+    def _load_raw_settings(self, file_path: Path) -> dict[str, Any]:
+        """Load the raw integrations mapping, preferring a JSON sidecar cache.
+
+        YAML parsing dominates the load cost, so the parsed mapping is cached as
+        JSON next to the YAML file and reused while it is at least as new as the
+        YAML. The cache is rewritten atomically whenever the YAML changes.
 
         Args:
         ----
             file_path (Path): The path to the YAML file containing the integration settings.
 
+        Returns:
+        -------
+            dict[str, Any]: The raw integrations mapping from the YAML file.
+
         """
+        cache_path = file_path.with_suffix(file_path.suffix + ".cache.json")
+        try:
+            if cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+                with cache_path.open("r") as cache_file:
+                    return json.load(cache_file)
+        except (OSError, ValueError):
+            pass  # No cache, stale stat, or corrupt cache: fall through to YAML.
+
         with file_path.open("r") as file:
-            data = yaml.safe_load(file).get("integrations", {})
-            for name, config in data.items():
-                self._settings[name] = self._parse_integration(name, config)
+            # An empty YAML file loads as None, hence the `or {}`.
+            data = (yaml.load(file, Loader=_YamlLoader) or {}).get("integrations") or {}
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(data, cache_file)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError):
+            # Read-only filesystem, or YAML values json can't serialize (e.g.
+            # unquoted dates parse as datetime): caching is best-effort.
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+        return data
 
     def get_by_short_name(self, short_name: str) -> BaseAuthSettings:
         """Retrieves settings for a specific integration by its short name.
@@ -100,6 +171,7 @@ class IntegrationSettings:
             KeyError: If the integration settings are not found.
 
         """
+        self.load_settings()
         settings = self._settings.get(short_name)
         if not settings:
             raise KeyError(f"Integration settings not found for {short_name}")
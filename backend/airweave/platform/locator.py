@@ -1,7 +1,9 @@
 """Resource locator for platform resources."""
 
+import functools
 import importlib
-from typing import Callable, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Tuple, Type
 
 from airweave import schemas
 from airweave.platform.configs._base import BaseConfig
@@ -13,6 +15,24 @@ from airweave.platform.sources._base import BaseSource
 PLATFORM_PATH = "airweave.platform"
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve(module_path: str, attr: str) -> Any:
+    """Resolve an attribute from a module, caching the result.
+
+    Avoids re-running the import machinery and getattr on hot sync paths;
+    the set of platform modules is finite, so the cache stays bounded.
+    """
+    return getattr(importlib.import_module(module_path), attr)
+
+
+def _warm_resolve(module_path: str, attr: str) -> None:
+    """Best-effort _resolve call for background warm-up; never raises."""
+    try:
+        _resolve(module_path, attr)
+    except Exception:  # noqa: BLE001 - warm-up must not take down the app
+        pass
+
+
 class ResourceLocator:
     """Resource locator for platform resources.
 
@@ -24,6 +44,19 @@ class ResourceLocator:
     - transformers
     """
 
+    @staticmethod
+    def resolve(module_path: str, attr: str) -> Any:
+        """Resolve an attribute from a module through the shared cache.
+
+        Args:
+            module_path (str): Dotted path of the module to import
+            attr (str): Name of the attribute to fetch from the module
+
+        Returns:
+            Any: The resolved attribute
+        """
+        return _resolve(module_path, attr)
+
     @staticmethod
     def get_embedding_model(model: schemas.EmbeddingModel) -> Type[BaseEmbeddingModel]:
         """Get the embedding model class.
@@ -34,8 +67,7 @@ class ResourceLocator:
         Returns:
             Type[BaseEmbeddingModel]: Instantiated embedding model
         """
-        module = importlib.import_module(f"{PLATFORM_PATH}.embedding_models.{model.short_name}")
-        return getattr(module, model.class_name)
+        return _resolve(f"{PLATFORM_PATH}.embedding_models.{model.short_name}", model.class_name)
 
     @staticmethod
     def get_source(source: schemas.Source) -> Type[BaseSource]:
@@ -47,8 +79,7 @@ class ResourceLocator:
         Returns:
             Type[BaseSource]: Source class
         """
-        module = importlib.import_module(f"{PLATFORM_PATH}.sources.{source.short_name}")
-        return getattr(module, source.class_name)
+        return _resolve(f"{PLATFORM_PATH}.sources.{source.short_name}", source.class_name)
 
     @staticmethod
     def get_destination(destination: schemas.Destination) -> Type[BaseDestination]:
@@ -60,8 +91,9 @@ class ResourceLocator:
         Returns:
             Type[BaseDestination]: Destination class
         """
-        module = importlib.import_module(f"{PLATFORM_PATH}.destinations.{destination.short_name}")
-        return getattr(module, destination.class_name)
+        return _resolve(
+            f"{PLATFORM_PATH}.destinations.{destination.short_name}", destination.class_name
+        )
 
     @staticmethod
     def get_auth_config(auth_config_class: str) -> Type[BaseConfig]:
@@ -73,9 +105,7 @@ class ResourceLocator:
         Returns:
             Type[BaseConfig]: Auth config class
         """
-        module = importlib.import_module(f"{PLATFORM_PATH}.configs.auth")
-        auth_config_class = getattr(module, auth_config_class)
-        return auth_config_class
+        return _resolve(f"{PLATFORM_PATH}.configs.auth", auth_config_class)
 
     @staticmethod
     def get_transformer(transformer: schemas.Transformer) -> Callable:
@@ -87,8 +117,7 @@ class ResourceLocator:
         Returns:
             Callable: Transformer function
         """
-        module = importlib.import_module(transformer.module_name)
-        return getattr(module, transformer.method_name)
+        return _resolve(transformer.module_name, transformer.method_name)
 
     @staticmethod
     def get_entity_definition(entity_definition: schemas.EntityDefinition) -> Type[BaseEntity]:
@@ -100,10 +129,45 @@ class ResourceLocator:
         Returns:
             Type[BaseEntity]: Entity definition class
         """
-        module = importlib.import_module(
-            f"{PLATFORM_PATH}.entities.{entity_definition.module_name}"
+        return _resolve(
+            f"{PLATFORM_PATH}.entities.{entity_definition.module_name}",
+            entity_definition.class_name,
         )
-        return getattr(module, entity_definition.class_name)
+
+    @staticmethod
+    def warmup(
+        sources: Iterable[schemas.Source] = (),
+        destinations: Iterable[schemas.Destination] = (),
+        transformers: Iterable[schemas.Transformer] = (),
+        entity_definitions: Iterable[schemas.EntityDefinition] = (),
+    ) -> None:
+        """Warm the resolve cache for the given resources in background threads.
+
+        Fire-and-forget: imports run on a thread pool so the first sync finds
+        the cache hot without blocking startup. The interpreter releases the
+        GIL during module file I/O, so the imports overlap with other init work.
+
+        Args:
+            sources (Iterable[schemas.Source]): Sources to pre-import
+            destinations (Iterable[schemas.Destination]): Destinations to pre-import
+            transformers (Iterable[schemas.Transformer]): Transformers to pre-import
+            entity_definitions (Iterable[schemas.EntityDefinition]): Entity definitions
+                to pre-import
+        """
+        entries: list[Tuple[str, str]] = []
+        entries += [(f"{PLATFORM_PATH}.sources.{s.short_name}", s.class_name) for s in sources]
+        entries += [
+            (f"{PLATFORM_PATH}.destinations.{d.short_name}", d.class_name) for d in destinations
+        ]
+        entries += [(t.module_name, t.method_name) for t in transformers]
+        entries += [
+            (f"{PLATFORM_PATH}.entities.{e.module_name}", e.class_name) for e in entity_definitions
+        ]
+
+        executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="locator-warmup")
+        for module_path, attr in entries:
+            executor.submit(_warm_resolve, module_path, attr)
+        executor.shutdown(wait=False)
 
 
 resource_locator = ResourceLocator()
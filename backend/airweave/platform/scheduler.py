@@ -388,7 +388,7 @@ class PlatformScheduler:
 
             # Convert to schemas
             sync_job_schema = schemas.SyncJob.model_validate(sync_job)
-            sync_dag_schema = schemas.SyncDag.model_validate(sync_dag)
+            sync_dag_schema = schemas.SyncDag.from_orm_trusted(sync_dag)
 
             # Run the sync using the original user
             logger.info(f"Starting sync task for job {sync_job.id} (sync {sync.id})")
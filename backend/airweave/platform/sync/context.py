@@ -1,9 +1,11 @@
 """Module for sync context."""
 
-import importlib
-from typing import Optional
+import asyncio
+from functools import lru_cache
+from typing import AsyncContextManager, Callable, Optional
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
@@ -14,8 +16,6 @@ from airweave.platform.auth.schemas import AuthType
 from airweave.platform.auth.services import oauth2_service
 from airweave.platform.destinations._base import BaseDestination, VectorDBDestination
 from airweave.platform.embedding_models._base import BaseEmbeddingModel
-from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
-from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
 from airweave.platform.entities._base import BaseEntity
 from airweave.platform.locator import resource_locator
 from airweave.platform.sources._base import BaseSource
@@ -23,6 +23,16 @@ from airweave.platform.sync.pubsub import SyncProgress
 from airweave.platform.sync.router import SyncDAGRouter
 
 
+@lru_cache(maxsize=None)
+def _auth_config_adapter(auth_config_class: str) -> TypeAdapter:
+    """Get a pre-compiled validator for an auth config class, cached per class.
+
+    TypeAdapter compiles its core schema once; reusing the adapter avoids
+    re-resolving the class and rebuilding validators on every source creation.
+    """
+    return TypeAdapter(resource_locator.get_auth_config(auth_config_class))
+
+
 class SyncContext:
     """Context container for a sync.
 
@@ -37,8 +47,29 @@ class SyncContext:
     - progress - the progress tracker, interfaces with PubSub
     - router - the DAG router
     - white label (optional)
+
+    All fields are already validated by the time the context is assembled, so
+    constructors on this path may build schemas directly (model_construct)
+    instead of re-running validation.
     """
 
+    # Slots keep the per-instance footprint small and make the per-entity
+    # attribute reads (ctx.router, ctx.progress, ...) direct offset loads.
+    __slots__ = (
+        "source",
+        "destinations",
+        "embedding_model",
+        "transformers",
+        "sync",
+        "sync_job",
+        "dag",
+        "progress",
+        "router",
+        "entity_map",
+        "current_user",
+        "white_label",
+    )
+
     source: BaseSource
     destinations: list[BaseDestination]
     embedding_model: BaseEmbeddingModel
@@ -50,8 +81,7 @@ class SyncContext:
     router: SyncDAGRouter
     entity_map: dict[type[BaseEntity], UUID]
     current_user: schemas.User
-
-    white_label: Optional[schemas.WhiteLabel] = None
+    white_label: Optional[schemas.WhiteLabel]
 
     def __init__(
         self,
@@ -95,15 +125,43 @@ class SyncContextFactory:
         dag: schemas.SyncDag,
         current_user: schemas.User,
         white_label: Optional[schemas.WhiteLabel] = None,
+        db_session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]] = None,
     ) -> SyncContext:
-        """Create a sync context."""
-        source = await cls._create_source_instance(db=db, sync=sync, current_user=current_user)
+        """Create a sync context.
+
+        When a session factory is provided, the independent database fetches
+        (source, destinations, transformers, entity definitions) run concurrently
+        with one session per task, so context creation takes roughly the slowest
+        fetch instead of their sum. Without a factory everything runs
+        sequentially on the shared session, which is required for callers that
+        need the work inside a single transaction.
+        """
         embedding_model = cls._get_embedding_model(sync=sync)
-        destinations = await cls._create_destination_instances(
-            db=db, sync=sync, current_user=current_user, embedding_model=embedding_model
-        )
-        transformers = await cls._get_transformer_callables(db=db, sync=sync)
-        entity_map = await cls._get_entity_definition_map(db=db)
+
+        if db_session_factory is not None:
+
+            async def _with_session(method, /, **kwargs):
+                async with db_session_factory() as task_db:
+                    return await method(db=task_db, **kwargs)
+
+            source, destinations, transformers, entity_map = await asyncio.gather(
+                _with_session(cls._create_source_instance, sync=sync, current_user=current_user),
+                _with_session(
+                    cls._create_destination_instances,
+                    sync=sync,
+                    current_user=current_user,
+                    embedding_model=embedding_model,
+                ),
+                _with_session(cls._get_transformer_callables, sync=sync),
+                _with_session(cls._get_entity_definition_map),
+            )
+        else:
+            source = await cls._create_source_instance(db=db, sync=sync, current_user=current_user)
+            destinations = await cls._create_destination_instances(
+                db=db, sync=sync, current_user=current_user, embedding_model=embedding_model
+            )
+            transformers = await cls._get_transformer_callables(db=db, sync=sync)
+            entity_map = await cls._get_entity_definition_map(db=db)
 
         progress = SyncProgress(sync_job.id)
         router = SyncDAGRouter(dag, entity_map)
@@ -185,11 +243,9 @@ class SyncContextFactory:
         source_connection: schemas.Connection,
     ) -> BaseSource:
         """Create source instance for regular OAuth2."""
-        if not source_connection.integration_credential_id:
-            raise NotFoundException("Source connection has no integration credential")
-
-        credential = await cls._get_integration_credential(db, source_connection, current_user)
-        decrypted_credential = credentials.decrypt(credential.encrypted_credentials)
+        decrypted_credential = await cls._get_decrypted_credential(
+            db, source_connection, current_user
+        )
         return await source_class.create(decrypted_credential["access_token"])
 
     @classmethod
@@ -202,19 +258,35 @@ class SyncContextFactory:
         source_connection: schemas.Connection,
     ) -> BaseSource:
         """Create source instance for other authentication types."""
-        if not source_connection.integration_credential_id:
-            raise NotFoundException("Source connection has no integration credential")
-
-        credential = await cls._get_integration_credential(db, source_connection, current_user)
-        decrypted_credential = credentials.decrypt(credential.encrypted_credentials)
+        decrypted_credential = await cls._get_decrypted_credential(
+            db, source_connection, current_user
+        )
 
         if not source_model.auth_config_class:
             raise ValueError(f"Auth config class required for auth type {source_model.auth_type}")
 
-        auth_config = resource_locator.get_auth_config(source_model.auth_config_class)
-        source_credentials = auth_config.model_validate(decrypted_credential)
+        adapter = _auth_config_adapter(source_model.auth_config_class)
+        source_credentials = adapter.validate_python(decrypted_credential)
         return await source_class.create(source_credentials)
 
+    @classmethod
+    async def _get_decrypted_credential(
+        cls,
+        db: AsyncSession,
+        source_connection: schemas.Connection,
+        current_user: schemas.User,
+    ) -> dict:
+        """Fetch and decrypt the integration credential for a source connection.
+
+        Shared by the OAuth2 and other-auth source creation paths so the fetch,
+        the credential-id guard and the decrypt live in one place.
+        """
+        if not source_connection.integration_credential_id:
+            raise NotFoundException("Source connection has no integration credential")
+
+        credential = await cls._get_integration_credential(db, source_connection, current_user)
+        return credentials.decrypt(credential.encrypted_credentials)
+
     @classmethod
     async def _get_integration_credential(
         cls,
@@ -242,14 +314,21 @@ class SyncContextFactory:
         Returns:
             BaseEmbeddingModel: The embedding model to use
         """
-        # Use OpenAI if API key is available
+        # The embedding model modules pull heavy dependencies, so import them
+        # lazily here rather than at module top: anything importing SyncContext
+        # (Alembic env, CLI tools) would otherwise pay the cost up front.
         from airweave.core.logging import logger
 
+        # Use OpenAI if API key is available
         if settings.OPENAI_API_KEY:
+            from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
+
             logger.info(f"Using OpenAI embedding model (text-embedding-3-small) for sync {sync.id}")
             return OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
 
         # Otherwise use the local model
+        from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
+
         logger.info(f"Using local embedding model (MiniLM-L6-v2) for sync {sync.id}")
         return LocalText2Vec()
 
@@ -313,12 +392,11 @@ class SyncContextFactory:
         cls, db: AsyncSession, sync: schemas.Sync
     ) -> dict[str, callable]:
         """Get transformers instance."""
-        transformers = {}
-
-        transformer_functions = await crud.transformer.get_all(db)
-        for transformer in transformer_functions:
-            transformers[transformer.method_name] = resource_locator.get_transformer(transformer)
-        return transformers
+        callable_locations = await crud.transformer.get_callable_locations(db)
+        return {
+            method_name: resource_locator.resolve(module_name, method_name)
+            for module_name, method_name in callable_locations
+        }
 
     @classmethod
     async def _get_entity_definition_map(cls, db: AsyncSession) -> dict[type[BaseEntity], UUID]:
@@ -329,13 +407,11 @@ class SyncContextFactory:
         Example key-value pair:
             <class 'airweave.platform.entities.trello.TrelloBoard'>: entity_definition_id
         """
-        entity_definitions = await crud.entity_definition.get_all(db)
-
-        entity_definition_map = {}
-        for entity_definition in entity_definitions:
-            full_module_name = f"airweave.platform.entities.{entity_definition.module_name}"
-            module = importlib.import_module(full_module_name)
-            entity_class = getattr(module, entity_definition.class_name)
-            entity_definition_map[entity_class] = entity_definition.id
-
-        return entity_definition_map
+        class_locations = await crud.entity_definition.get_class_locations(db)
+
+        return {
+            resource_locator.resolve(
+                f"airweave.platform.entities.{module_name}", class_name
+            ): entity_definition_id
+            for entity_definition_id, module_name, class_name in class_locations
+        }
@@ -1,5 +1,6 @@
 """DAG router."""
 
+from collections import defaultdict
 from typing import Optional
 from uuid import UUID
 
@@ -22,6 +23,23 @@ class SyncDAGRouter:
         """Initialize the DAG router."""
         self.dag = dag
         self.entity_map = entity_map
+
+        # The DAG is immutable within a sync, so index it once up front:
+        # node lookups and edge traversals become O(1) dict hits instead of
+        # scanning the node/edge lists per entity hop.
+        self._node_by_id: dict[UUID, DagNode] = dag.nodes_by_id
+        out_edges: dict[UUID, list[UUID]] = defaultdict(list)
+        in_edges: dict[UUID, list[UUID]] = defaultdict(list)
+        for edge in dag.edges:
+            out_edges[edge.from_node_id].append(edge.to_node_id)
+            in_edges[edge.to_node_id].append(edge.from_node_id)
+        self._out: dict[UUID, tuple[UUID, ...]] = {
+            node_id: tuple(to_ids) for node_id, to_ids in out_edges.items()
+        }
+        self._in: dict[UUID, tuple[UUID, ...]] = {
+            node_id: tuple(from_ids) for node_id, from_ids in in_edges.items()
+        }
+
         self.route = self._build_execution_route()
 
     def _build_execution_route(self) -> dict[tuple[UUID, UUID], list[Optional[UUID]]]:
@@ -35,31 +53,25 @@ class SyncDAGRouter:
         route_map = {}
         for node in self.dag.nodes:
             if node.type == NodeType.entity:
-                edge_inwards = self.dag.get_edges_to_node(node.id)
-
                 # Get the producer node
-                producer = edge_inwards[0].from_node_id
+                producer = self._in[node.id][0]
 
-                edges_outwards = self.dag.get_edges_from_node(node.id)
+                outward_node_ids = self._out.get(node.id, ())
 
                 # Check if all outgoing edges go to destination nodes
-                if edges_outwards:
-                    all_destinations = True
-                    for edge in edges_outwards:
-                        consumer_node = self.dag.get_node(edge.to_node_id)
-                        if consumer_node.type != NodeType.destination:
-                            all_destinations = False
-                            break
+                if outward_node_ids:
+                    all_destinations = all(
+                        self._node_by_id[to_id].type == NodeType.destination
+                        for to_id in outward_node_ids
+                    )
 
                     if all_destinations:
                         # If all outgoing edges go to destinations, stop routing
                         route_map[(producer, node.entity_definition_id)] = None
-                    elif len(edges_outwards) == 1:
+                    elif len(outward_node_ids) == 1:
                         # If there's only one outgoing edge and it's not to a destination,
                         # route to that node
-                        route_map[(producer, node.entity_definition_id)] = edges_outwards[
-                            0
-                        ].to_node_id
+                        route_map[(producer, node.entity_definition_id)] = outward_node_ids[0]
                     else:
                         # If there are multiple outgoing edges and not all go to destinations,
                         # this is an invalid configuration
@@ -138,7 +150,7 @@ class SyncDAGRouter:
         consumer_id = self.route[route_key]
 
         # Get the consumer node
-        consumer = self.dag.get_node(consumer_id)
+        consumer = self._node_by_id[consumer_id]
 
         # Apply the transformer
         transformed_entities = await self._apply_transformer(db, consumer, entity)
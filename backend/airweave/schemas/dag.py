@@ -1,10 +1,11 @@
 """Schemas for DAG system."""
 
 from enum import Enum
+from functools import cached_property
 from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NodeType(str, Enum):
@@ -53,17 +54,14 @@ class DagNodeUpdate(DagNodeBase):
 class DagNode(DagNodeBase):
     """Schema for a DAG node."""
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     id: UUID
     dag_id: UUID
     organization_id: UUID
     created_by_email: str
     modified_by_email: str
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-
 
 class DagEdgeBase(BaseModel):
     """Base schema for DAG edge."""
@@ -87,17 +85,14 @@ class DagEdgeUpdate(DagEdgeBase):
 class DagEdge(DagEdgeBase):
     """Schema for a DAG edge."""
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     id: UUID
     dag_id: UUID
     organization_id: UUID
     created_by_email: str
     modified_by_email: str
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-
 
 class SyncDagBase(BaseModel):
     """Base schema for sync DAG definition."""
@@ -136,6 +131,8 @@ class SyncDag(SyncDagBase):
     Transformers are both producers and consumers.
     """
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     id: UUID
     organization_id: UUID
     created_by_email: str
@@ -143,12 +140,54 @@ class SyncDag(SyncDagBase):
     nodes: list[DagNode]
     edges: list[DagEdge]
 
+    @classmethod
+    def from_orm_trusted(cls, sync_dag) -> "SyncDag":
+        """Construct a SyncDag from an ORM row without re-running validation.
+
+        DAG rows are validated when written, so the sync-run hot path can skip
+        pydantic validation entirely with `model_construct`. Only use this for
+        rows read straight from the database; external input must keep going
+        through `model_validate`.
+
+        Args:
+            sync_dag: The SyncDag ORM model to convert.
+
+        Returns:
+            SyncDag: The constructed schema, validation skipped.
+        """
+        return cls.model_construct(
+            name=sync_dag.name,
+            description=sync_dag.description,
+            sync_id=sync_dag.sync_id,
+            id=sync_dag.id,
+            organization_id=sync_dag.organization_id,
+            created_by_email=sync_dag.created_by_email,
+            modified_by_email=sync_dag.modified_by_email,
+            nodes=[
+                DagNode.model_construct(
+                    **{field: getattr(node, field) for field in DagNode.model_fields}
+                )
+                for node in sync_dag.nodes
+            ],
+            edges=[
+                DagEdge.model_construct(
+                    **{field: getattr(edge, field) for field in DagEdge.model_fields}
+                )
+                for edge in sync_dag.edges
+            ],
+        )
+
+    @cached_property
+    def nodes_by_id(self) -> Dict[UUID, DagNode]:
+        """Index of nodes by id, built once; the DAG is immutable within a sync."""
+        return {node.id: node for node in self.nodes}
+
     def get_node(self, node_id: UUID) -> DagNode:
         """Get a node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        raise ValueError(f"Node with ID {node_id} not found")
+        node = self.nodes_by_id.get(node_id)
+        if node is None:
+            raise ValueError(f"Node with ID {node_id} not found")
+        return node
 
     def get_edges_from_node(self, node_id: UUID) -> list[DagEdge]:
         """Get an edge that points from a node."""
@@ -176,8 +215,3 @@ class SyncDag(SyncDagBase):
     def get_destination_nodes(self) -> list[DagNode]:
         """Get all destination nodes."""
         return [node for node in self.nodes if node.type == NodeType.destination]
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
@@ -0,0 +1,44 @@
+"""Store sync_metadata as JSONB with a GIN index
+
+Revision ID: b3d1c2a9e4f0
+Revises: 1e286802b4d3
+Create Date: 2025-05-12 09:14:27.318502
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d1c2a9e4f0'
+down_revision = '1e286802b4d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # JSONB is parsed once at write and stored in binary form, so reads no
+    # longer reparse the text column and containment queries can use GIN.
+    op.alter_column(
+        "sync",
+        "sync_metadata",
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using="sync_metadata::jsonb",
+    )
+    op.create_index(
+        "ix_sync_sync_metadata_gin",
+        "sync",
+        ["sync_metadata"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade():
+    op.drop_index("ix_sync_sync_metadata_gin", table_name="sync")
+    op.alter_column(
+        "sync",
+        "sync_metadata",
+        type_=sa.JSON(),
+        postgresql_using="sync_metadata::json",
+    )
@@ -0,0 +1 @@
+"""Unit tests for the platform auth module."""
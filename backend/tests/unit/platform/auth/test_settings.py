@@ -0,0 +1,89 @@
+"""Unit tests for the IntegrationSettings loading and caching behavior."""
+
+import json
+import os
+
+import pytest
+
+from airweave.platform.auth.settings import IntegrationSettings
+
+YAML_CONTENT = """
+integrations:
+  test_source:
+    auth_type: api_key
+"""
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    """Write an integrations YAML file to a temporary directory."""
+    file_path = tmp_path / "dev.integrations.yaml"
+    file_path.write_text(YAML_CONTENT)
+    return file_path
+
+
+def _cache_path(yaml_path):
+    return yaml_path.with_suffix(yaml_path.suffix + ".cache.json")
+
+
+class TestLoadRawSettings:
+    """Tests for the JSON sidecar cache around the YAML parse."""
+
+    def test_yaml_parse_writes_cache(self, yaml_file):
+        """A cold load parses the YAML and leaves a JSON sidecar behind."""
+        settings = IntegrationSettings(yaml_file)
+
+        data = settings._load_raw_settings(yaml_file)
+
+        assert data == {"test_source": {"auth_type": "api_key"}}
+        cache_path = _cache_path(yaml_file)
+        assert cache_path.exists()
+        assert json.loads(cache_path.read_text()) == data
+
+    def test_fresh_cache_is_used_instead_of_yaml(self, yaml_file):
+        """A cache at least as new as the YAML is returned without re-parsing."""
+        settings = IntegrationSettings(yaml_file)
+        cache_path = _cache_path(yaml_file)
+        cache_path.write_text(json.dumps({"from_cache": {"auth_type": "api_key"}}))
+        os.utime(cache_path, (yaml_file.stat().st_mtime + 10,) * 2)
+
+        data = settings._load_raw_settings(yaml_file)
+
+        assert data == {"from_cache": {"auth_type": "api_key"}}
+
+    def test_stale_cache_falls_back_to_yaml(self, yaml_file):
+        """A cache older than the YAML is ignored and rewritten from the YAML."""
+        settings = IntegrationSettings(yaml_file)
+        cache_path = _cache_path(yaml_file)
+        cache_path.write_text(json.dumps({"stale": {"auth_type": "api_key"}}))
+        os.utime(cache_path, (yaml_file.stat().st_mtime - 10,) * 2)
+
+        data = settings._load_raw_settings(yaml_file)
+
+        assert data == {"test_source": {"auth_type": "api_key"}}
+        assert json.loads(cache_path.read_text()) == data
+
+    def test_corrupt_cache_falls_back_to_yaml(self, yaml_file):
+        """A cache that is not valid JSON is ignored in favor of the YAML."""
+        settings = IntegrationSettings(yaml_file)
+        cache_path = _cache_path(yaml_file)
+        cache_path.write_text("{not valid json")
+        os.utime(cache_path, (yaml_file.stat().st_mtime + 10,) * 2)
+
+        data = settings._load_raw_settings(yaml_file)
+
+        assert data == {"test_source": {"auth_type": "api_key"}}
+
+    def test_unserializable_yaml_skips_cache_without_crashing(self, yaml_file):
+        """YAML values json cannot serialize (dates) skip the cache write cleanly."""
+        yaml_file.write_text(
+            "integrations:\n  test_source:\n    auth_type: api_key\n    expires: 2025-01-01\n"
+        )
+        settings = IntegrationSettings(yaml_file)
+
+        data = settings._load_raw_settings(yaml_file)
+
+        assert data["test_source"]["auth_type"] == "api_key"
+        assert not _cache_path(yaml_file).exists()
+        # The failed write must not leak its mkstemp temp file either.
+        assert not list(yaml_file.parent.glob("*.tmp"))
@@ -118,7 +118,12 @@ class TestSyncServiceIntegration:
             # Run assertions
             mock_get_db_context.assert_called_once()
             mock_create_context.assert_called_once_with(
-                mock_db, created_sync, sync_job, mock_sync_dag, mock_user
+                mock_db,
+                created_sync,
+                sync_job,
+                mock_sync_dag,
+                mock_user,
+                db_session_factory=mock_get_db_context,
             )
             mock_run.assert_called_once_with(mock_sync_context)
 
@@ -0,0 +1,109 @@
+"""Unit tests for the SyncDag schema."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from airweave.schemas.dag import SyncDag
+
+
+def _orm_shaped_dag():
+    """Build an ORM-shaped SyncDag object with nodes and edges."""
+    dag_id = uuid.uuid4()
+    organization_id = uuid.uuid4()
+    source_node_id = uuid.uuid4()
+    entity_node_id = uuid.uuid4()
+    destination_node_id = uuid.uuid4()
+    entity_definition_id = uuid.uuid4()
+    common = {
+        "dag_id": dag_id,
+        "organization_id": organization_id,
+        "created_by_email": "test@airweave.ai",
+        "modified_by_email": "test@airweave.ai",
+    }
+    nodes = [
+        SimpleNamespace(
+            id=source_node_id,
+            type="source",
+            name="Test Source",
+            config=None,
+            connection_id=uuid.uuid4(),
+            entity_definition_id=None,
+            transformer_id=None,
+            **common,
+        ),
+        SimpleNamespace(
+            id=entity_node_id,
+            type="entity",
+            name="Test Entity",
+            config=None,
+            connection_id=None,
+            entity_definition_id=entity_definition_id,
+            transformer_id=None,
+            **common,
+        ),
+        SimpleNamespace(
+            id=destination_node_id,
+            type="destination",
+            name="Test Destination",
+            config=None,
+            connection_id=uuid.uuid4(),
+            entity_definition_id=None,
+            transformer_id=None,
+            **common,
+        ),
+    ]
+    edges = [
+        SimpleNamespace(
+            id=uuid.uuid4(), from_node_id=source_node_id, to_node_id=entity_node_id, **common
+        ),
+        SimpleNamespace(
+            id=uuid.uuid4(), from_node_id=entity_node_id, to_node_id=destination_node_id, **common
+        ),
+    ]
+    return SimpleNamespace(
+        id=dag_id,
+        name="Test DAG",
+        description=None,
+        sync_id=uuid.uuid4(),
+        organization_id=organization_id,
+        created_by_email="test@airweave.ai",
+        modified_by_email="test@airweave.ai",
+        nodes=nodes,
+        edges=edges,
+    )
+
+
+class TestFromOrmTrusted:
+    """Tests for the trusted, validation-free SyncDag constructor."""
+
+    def test_matches_model_validate(self):
+        """from_orm_trusted must produce the same schema as model_validate.
+
+        Guards the field-for-field model_construct mirror against drift when a
+        schema field is added or an ORM column is renamed.
+        """
+        row = _orm_shaped_dag()
+
+        trusted = SyncDag.from_orm_trusted(row)
+        validated = SyncDag.model_validate(row)
+
+        assert trusted == validated
+        assert [n.model_dump() for n in trusted.nodes] == [
+            n.model_dump() for n in validated.nodes
+        ]
+        assert [e.model_dump() for e in trusted.edges] == [
+            e.model_dump() for e in validated.edges
+        ]
+
+    def test_node_indexes_work_on_trusted_instance(self):
+        """The cached node index behaves the same on a trusted instance."""
+        row = _orm_shaped_dag()
+
+        dag = SyncDag.from_orm_trusted(row)
+
+        for node in dag.nodes:
+            assert dag.get_node(node.id) is node
+        with pytest.raises(ValueError):
+            dag.get_node(uuid.uuid4())